@@ -1,23 +1,122 @@
 from __future__ import annotations
 
-import json
+import pickle
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, Sequence, Tuple
+
+from .jsonio import load_json
 
 
 ASSET_DESCRIPTIONS_PATH = Path("assets/asset_descriptions.json")
 
+# Fixed keyword vocabulary used by event-type scoring. Each asset gets a
+# bitmask of the keywords its description contains, computed once at load
+# time, so scoring an asset is a couple of integer ANDs instead of one
+# substring scan per keyword per event.
+KEYWORDS = ("scores", "goal", "celebrates", "celebration", "penalty", "card", "action")
+
+_KW = {keyword: 1 << i for i, keyword in enumerate(KEYWORDS)}
+
+# Per event type: (keyword-group mask, points) pairs. A group scores its
+# points when the description contains any keyword in the group.
+# More event types can be added here if needed.
+EVENT_WEIGHTS = {
+    "goal": (
+        (_KW["scores"] | _KW["goal"], 25),
+        (_KW["celebrates"] | _KW["celebration"], 15),
+    ),
+    "penalty goal": (
+        (_KW["scores"] | _KW["goal"], 25),
+        (_KW["celebrates"] | _KW["celebration"], 15),
+        (_KW["penalty"], 25),
+    ),
+    "yellow card": (
+        (_KW["card"], 10),
+    ),
+    "red card": (
+        (_KW["card"], 10),
+    ),
+    "penalty won": (
+        (_KW["penalty"], 25),
+    ),
+    "penalty lost": (
+        (_KW["penalty"], 25),
+    ),
+    # Near misses: prefer match-action shots over posed/crowd ones.
+    "attempt saved": (
+        (_KW["action"], 10),
+    ),
+    "attempt blocked": (
+        (_KW["action"], 10),
+    ),
+    "miss": (
+        (_KW["action"], 10),
+    ),
+    "post": (
+        (_KW["action"], 10),
+    ),
+}
+
+
+def _keyword_mask(desc_lower: str) -> int:
+    return sum(bit for keyword, bit in _KW.items() if keyword in desc_lower)
+
+
+@dataclass(frozen=True)
+class AssetDB:
+    """
+    Struct-of-arrays view of the asset descriptions: parallel tuples
+    indexed by asset, so the scoring loop reads plain tuple slots instead
+    of doing a dict lookup per field per asset.
+    """
+
+    filenames: Tuple[str, ...]
+    descriptions_lower: Tuple[str, ...]
+    kw_masks: Tuple[int, ...]
+
+    def __len__(self) -> int:
+        return len(self.filenames)
 
-def load_asset_descriptions(path: Path = ASSET_DESCRIPTIONS_PATH) -> List[Dict[str, Any]]:
+
+def load_asset_descriptions(path: Path = ASSET_DESCRIPTIONS_PATH) -> AssetDB:
     """
     Load the asset_descriptions.json file.
 
     Expected structure: a list of objects with:
         - filename: str
         - description: str
+
+    Results are cached per (path, mtime), so repeated builds do not
+    re-read and re-parse an unchanged file.
     """
-    raw = path.read_text(encoding="utf-8")
-    data = json.loads(raw)
+    path = Path(path)
+    return _load_asset_descriptions(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _load_asset_descriptions(path_str: str, mtime_ns: int) -> AssetDB:
+    path = Path(path_str)
+
+    # Disk-level cache of the normalized AssetDB (lowercased descriptions
+    # and keyword masks included) next to the source file, keyed by
+    # mtime: fresh processes skip the JSON parse and normalization pass.
+    cache_path = path.with_suffix(".cache.pkl")
+    try:
+        if cache_path.stat().st_mtime_ns >= mtime_ns:
+            with open(cache_path, "rb") as f:
+                keywords, cached = pickle.load(f)
+            # The stored vocabulary must match: kw_masks are only
+            # meaningful against the KEYWORDS they were built from.
+            if keywords == KEYWORDS and isinstance(cached, AssetDB):
+                return cached
+    except (OSError, pickle.PickleError, EOFError, TypeError, ValueError):
+        # Missing or unreadable cache: fall through and reparse.
+        pass
+
+    data = load_json(path)
 
     # Normalise structure in case the file is wrapped in a top level key later
     if isinstance(data, dict) and "assets" in data:
@@ -25,62 +124,66 @@ def load_asset_descriptions(path: Path = ASSET_DESCRIPTIONS_PATH) -> List[Dict[s
     else:
         assets = data
 
-    normalised: List[Dict[str, Any]] = []
+    filenames = []
+    descriptions_lower = []
+    kw_masks = []
     for item in assets:
         filename = str(item.get("filename", "")).strip()
         desc = str(item.get("description", "")).strip()
         if not filename or not desc:
             continue
-        normalised.append(
-            {
-                "filename": filename,
-                "description": desc,
-                "description_lower": desc.lower(),
-            }
-        )
-    return normalised
+        desc_lower = desc.lower()
+        filenames.append(filename)
+        descriptions_lower.append(desc_lower)
+        kw_masks.append(_keyword_mask(desc_lower))
+
+    # Frozen tuples so callers cannot mutate the cached value.
+    db = AssetDB(
+        filenames=tuple(filenames),
+        descriptions_lower=tuple(descriptions_lower),
+        kw_masks=tuple(kw_masks),
+    )
+
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((KEYWORDS, db), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        # Read-only assets directory is fine; we just lose the cache.
+        pass
+
+    return db
 
 
 def _score_asset_for_event(
-    asset: Dict[str, Any],
-    event_type: str,
-    candidate_player_names: Sequence[str],
+    desc_lower: str,
+    kw_mask: int,
+    name_pat: "re.Pattern[str] | None",
+    weights: Sequence[Tuple[int, int]],
 ) -> int:
     """
     Compute a relevance score of a single asset for a given event.
 
     Heuristics:
-    - Strong bonus if any player name appears in the description.
+    - Strong bonus per involved player whose name appears in the
+      description.
     - Extra bonuses based on event type keywords in the description.
+
+    name_pat is the alternation of lowercased player names compiled once
+    per event in pick_asset_for_event, and weights is the EVENT_WEIGHTS
+    entry for the event type.
     """
-    desc = asset["description_lower"]
     score = 0
 
-    # 1) Direct player name matches
-    for name in candidate_player_names:
-        n = name.strip()
-        if not n:
-            continue
-        if n.lower() in desc:
-            # Strong signal, this image clearly shows this player
-            score += 100
-
-    # 2) Event type specific keywords
-    if event_type in ("goal", "penalty goal"):
-        if "scores" in desc or "goal" in desc:
-            score += 25
-        if "celebrates" in desc or "celebration" in desc:
-            score += 15
-
-    if event_type == "penalty goal":
-        if "penalty" in desc:
-            score += 25
+    # 1) Direct player name matches: one regex scan instead of one
+    # substring scan per candidate. Each distinct player found is a
+    # strong signal that the image clearly shows them.
+    if name_pat is not None:
+        score += 100 * len(set(name_pat.findall(desc_lower)))
 
-    if event_type in ("yellow card",):
-        if "card" in desc:
-            score += 10
-
-    # More types could be added here if needed
+    # 2) Event type specific keywords, via the precomputed bitmask
+    for group_mask, points in weights:
+        if kw_mask & group_mask:
+            score += points
 
     return score
 
@@ -88,36 +191,58 @@ def _score_asset_for_event(
 def pick_asset_for_event(
     event: Dict[str, Any],
     player_names: Sequence[str],
-    assets: Sequence[Dict[str, Any]],
+    assets: AssetDB,
     default_asset: str = "../assets/placeholder.png",
+    player_names_lower: "Sequence[str] | None" = None,
 ) -> str:
     """
     Choose the best image asset for a given event.
 
     - event: the match event dict
     - player_names: list of resolved player names involved in the event
-    - assets: list returned by load_asset_descriptions
+    - assets: the AssetDB returned by load_asset_descriptions
     - default_asset: used when nothing matches
+    - player_names_lower: optional pre-lowercased names (as produced at
+      squad-load time); when given, player_names is not re-normalized
 
     Returns a path relative to preview/index.html, for example:
         "../assets/21522436.jpg"
     """
-    if not assets:
+    if not len(assets):
         return default_asset
 
-    event_type = str(event.get("type", "")).lower().strip()
+    event_type = event.get("_type_lc") or str(event.get("type", "")).lower().strip()
+    weights = EVENT_WEIGHTS.get(event_type, ())
+
+    # Normalise the needles once per event instead of once per asset,
+    # dropping empties and duplicates, then compile them into a single
+    # alternation so each description is scanned once. Callers that
+    # already hold lowercased names skip the strip/lower pass entirely.
+    if player_names_lower is not None:
+        names_lower = tuple(dict.fromkeys(n for n in player_names_lower if n))
+    else:
+        names_lower = tuple(
+            dict.fromkeys(n.strip().lower() for n in player_names if n and n.strip())
+        )
+    name_pat = (
+        re.compile("|".join(re.escape(n) for n in names_lower))
+        if names_lower
+        else None
+    )
 
     best_score = 0
-    best_filename: str | None = None
+    best_index = -1
 
-    for asset in assets:
-        score = _score_asset_for_event(asset, event_type, player_names)
+    for i, (desc_lower, kw_mask) in enumerate(
+        zip(assets.descriptions_lower, assets.kw_masks)
+    ):
+        score = _score_asset_for_event(desc_lower, kw_mask, name_pat, weights)
         if score > best_score:
             best_score = score
-            best_filename = asset["filename"]
+            best_index = i
 
-    if best_filename is None:
+    if best_index < 0:
         return default_asset
 
     # preview/index.html is in preview/ and assets/ is a sibling of it
-    return f"../assets/{best_filename}"
+    return f"../assets/{assets.filenames[best_index]}"
@@ -1,3 +1,5 @@
+import sys
+
 BASE_SCORES = {
     "goal": 100,
     "penalty goal": 95,
@@ -12,6 +14,14 @@ BASE_SCORES = {
     "corner": 10,
 }
 
+# Interned keys make the per-event lookups identity-based and cheap when
+# the event types themselves are interned at canonicalization time.
+BASE_SCORES = {sys.intern(k): v for k, v in BASE_SCORES.items()}
+
+# Event types that can score at all. The main loop rejects everything
+# else before doing any scoring or bonus work.
+SCORING_TYPES = frozenset(BASE_SCORES)
+
 
 def get_base_score(event_type: str) -> int:
     """
@@ -20,29 +30,55 @@ def get_base_score(event_type: str) -> int:
     """
     return BASE_SCORES.get(event_type.lower().strip(), 0)
 
-def _parse_minute(event) -> int:
-    raw = event.get("minute", 0)
+def _safe_int(raw) -> int:
+    """
+    Coerce a feed value to int, defaulting to 0.
+
+    Feed fields are almost always ints already or ASCII digit strings;
+    the exact-type checks keep those common paths free of try-frame
+    setup, with the try/except kept as the catch-all for odd values.
+    """
+    if type(raw) is int:
+        return raw
+    if type(raw) is str and raw.isdigit():
+        return int(raw)
     try:
         return int(raw)
     except (TypeError, ValueError):
         return 0
 
 
-def compute_context_bonus(event, score_home, score_away, home_team_id: str, away_team_id: str) -> dict:
+def _parse_minute(event) -> int:
+    return _safe_int(event.get("minute", 0))
+
+
+def _event_type_lc(event) -> str:
     """
-    Compute a context bonus based on game state BEFORE this event.
-    Returns {"bonus": int, "reasons": [str, ...]}
-    home_team_id / away_team_id are the IDs from matchInfo.contestant.
-    
-    Bonus categories:
-    - late_game: +15 at minute 80+, +5 extra at 90+ 
-    - penalty_goal_bonus: +10 for penalty goals 
-    - first_goal: +25 (opens scoring)
-    - equalizer: +30 (ties match)
-    - go_ahead: +30 (breaks tie)
-    - extend_lead: +15 (1-goal to 2-goal lead)
-    - extend_big_lead: +5 (already winning by 2+)
-    - tight_game_chance: +20 (crucial saves/blocks in close matches at min 75+)
+    Canonical lowercased event type, preferring the "_type_lc" key that
+    build_story_from_files caches on each event so the normalization
+    runs once per event instead of once per consumer.
+    """
+    cached = event.get("_type_lc")
+    if cached is not None:
+        return cached
+    return str(event.get("type", "")).lower().strip()
+
+
+def _event_minute(event) -> int:
+    """
+    Event minute as an int, preferring the cached "_minute_int" key.
+    """
+    cached = event.get("_minute_int")
+    if cached is not None:
+        return cached
+    return _parse_minute(event)
+
+
+def _compute_context_bonus_impl(event, score_home, score_away, home_team_id: str, away_team_id: str) -> dict:
+    """
+    Reference implementation of the context bonus rules. Only used to
+    generate _BONUS_TABLE at import time; runtime calls go through the
+    table lookup in compute_context_bonus below.
     """
     minute = _parse_minute(event)
     event_type = str(event.get("type", "")).lower().strip()
@@ -114,22 +150,164 @@ def compute_context_bonus(event, score_home, score_away, home_team_id: str, away
     return {"bonus": bonus, "reasons": reasons}
 
 
+_GOAL_TYPES = ("goal", "penalty goal")
+_CHANCE_TYPES = ("attempt saved", "attempt blocked", "miss", "post")
+
+# Representative minute per bucket: <75, 75-79, 80-89, 90+.
+_BUCKET_MINUTES = (0, 75, 80, 90)
+
+
+def _minute_bucket(minute: int) -> int:
+    if minute < 75:
+        return 0
+    if minute < 80:
+        return 1
+    if minute < 90:
+        return 2
+    return 3
+
+
+def _build_bonus_table() -> dict:
+    """
+    Enumerate every (event category, minute bucket, scoreline state) the
+    bonus rules can distinguish and run the reference implementation on a
+    representative input for each, so runtime scoring is one dict lookup.
+
+    Scoreline state per category:
+    - goals: "first" (0-0), ("lead", L) with the scorer's lead before the
+      goal clamped to [-2, 2], or "unknown" when the team is unrecognised
+    - chances: ("tight", bool) for a close game
+    - everything else: None (only time-based bonuses apply)
+    """
+    home, away = "home", "away"
+    # Scorer is always "home" here; the rules only depend on the lead.
+    lead_scorelines = {-2: (0, 2), -1: (0, 1), 0: (1, 1), 1: (2, 1), 2: (2, 0)}
+
+    table = {}
+    for bucket, minute in enumerate(_BUCKET_MINUTES):
+        for etype in _GOAL_TYPES:
+            ev = {"type": etype, "minute": minute, "teamRef1": home}
+            res = _compute_context_bonus_impl(ev, 0, 0, home, away)
+            table[(etype, bucket, "first")] = (res["bonus"], tuple(res["reasons"]))
+
+            for lead, (h, a) in lead_scorelines.items():
+                res = _compute_context_bonus_impl(ev, h, a, home, away)
+                table[(etype, bucket, ("lead", lead))] = (res["bonus"], tuple(res["reasons"]))
+
+            unknown = {"type": etype, "minute": minute, "teamRef1": "?"}
+            res = _compute_context_bonus_impl(unknown, 0, 0, home, away)
+            table[(etype, bucket, "unknown")] = (res["bonus"], tuple(res["reasons"]))
+
+        for etype in _CHANCE_TYPES:
+            ev = {"type": etype, "minute": minute}
+            for tight, (h, a) in ((True, (0, 0)), (False, (3, 0))):
+                res = _compute_context_bonus_impl(ev, h, a, home, away)
+                table[(etype, bucket, ("tight", tight))] = (res["bonus"], tuple(res["reasons"]))
+
+        res = _compute_context_bonus_impl({"type": "other", "minute": minute}, 0, 0, home, away)
+        table[("*", bucket, None)] = (res["bonus"], tuple(res["reasons"]))
+
+    return table
+
+
+_BONUS_TABLE = _build_bonus_table()
+
+
+def compute_context_bonus(event, score_home, score_away, home_team_id: str, away_team_id: str) -> dict:
+    """
+    Compute a context bonus based on game state BEFORE this event.
+    Returns {"bonus": int, "reasons": [str, ...]}
+    home_team_id / away_team_id are the IDs from matchInfo.contestant.
+
+    Bonus categories:
+    - late_game: +15 at minute 80+, +5 extra at 90+
+    - penalty_goal_bonus: +10 for penalty goals
+    - first_goal: +25 (opens scoring)
+    - equalizer: +30 (ties match)
+    - go_ahead: +30 (breaks tie)
+    - extend_lead: +15 (1-goal to 2-goal lead)
+    - extend_big_lead: +5 (already winning by 2+)
+    - tight_game_chance: +20 (crucial saves/blocks in close matches at min 75+)
+
+    The cascade of rules lives in _compute_context_bonus_impl; here we
+    reduce the event to its (type, minute bucket, scoreline state) key
+    and look the result up in the precomputed _BONUS_TABLE.
+    """
+    minute = _event_minute(event)
+    event_type = _event_type_lc(event)
+    bucket = _minute_bucket(minute)
+
+    if event_type in _GOAL_TYPES:
+        team = event.get("teamRef1")
+        if team == home_team_id:
+            lead = score_home - score_away
+        elif team == away_team_id:
+            lead = score_away - score_home
+        else:
+            lead = None
+
+        if lead is None:
+            state = "unknown"
+        elif score_home == 0 and score_away == 0:
+            state = "first"
+        else:
+            state = ("lead", max(-2, min(2, lead)))
+        key = (event_type, bucket, state)
+    elif event_type in _CHANCE_TYPES:
+        key = (event_type, bucket, ("tight", abs(score_home - score_away) <= 1))
+    else:
+        key = ("*", bucket, None)
+
+    bonus, reasons = _BONUS_TABLE[key]
+    return {"bonus": bonus, "reasons": list(reasons)}
+
+
+# Shared result for non-scoring events; treat as read-only.
+_ZERO_SCORE = {
+    "score": 0,
+    "base": 0,
+    "context_bonus": 0,
+    "bonus_reasons": (),
+    "home_delta": 0,
+    "away_delta": 0,
+}
+
+
 def compute_final_score(event, score_home, score_away, home_team_id: str, away_team_id: str) -> dict:
     """
     Compute final score for an event using:
     - base score
     - context bonus
-    Returns {"score": int, "base": int, "context_bonus": int, "bonus_reasons": [str, ...]}
+    Returns {"score": int, "base": int, "context_bonus": int, "bonus_reasons": [str, ...],
+             "home_delta": int, "away_delta": int}
+
+    home_delta/away_delta are the scoreline change this event causes
+    (1/0 for a goal by the matching side, otherwise 0), so callers that
+    track a running score do not have to classify the event a second
+    time.
     """
-    base = get_base_score(event.get("type", ""))
+    event_type = _event_type_lc(event)
+    base = BASE_SCORES.get(event_type, 0)
     if base == 0:
-        return {"score": 0, "base": 0, "context_bonus": 0, "bonus_reasons": []}
+        return _ZERO_SCORE
     context_data = compute_context_bonus(event, score_home, score_away, home_team_id, away_team_id)
     context_bonus = context_data["bonus"]
     bonus_reasons = context_data["reasons"]
+
+    home_delta = 0
+    away_delta = 0
+    if event_type in _GOAL_TYPES:
+        team = event.get("_team", event.get("teamRef1"))
+        if team == home_team_id:
+            home_delta = 1
+        elif team == away_team_id:
+            away_delta = 1
+
     return {
         "score": base + context_bonus,
         "base": base,
         "context_bonus": context_bonus,
         "bonus_reasons": bonus_reasons,
+        "home_delta": home_delta,
+        "away_delta": away_delta,
     }
@@ -0,0 +1,32 @@
+"""
+Thin JSON helpers shared by the loaders and the story writer.
+
+orjson parses and serializes several times faster than the stdlib json
+module and works on bytes directly, skipping a UTF-8 decode step. It is
+an optional speedup though: when it is not installed we fall back to the
+stdlib so the builder keeps working everywhere.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json still works
+    orjson = None
+
+
+def load_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def dump_json_bytes(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
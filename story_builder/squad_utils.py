@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional
 
+from .jsonio import load_json
 
-def load_squad_players(path: Path) -> Dict[str, str]:
+
+class PlayerInfo(NamedTuple):
+    """
+    A player's display name plus its lowercased form, so downstream
+    matching (asset descriptions) never re-lowercases per use.
+    """
+
+    name: str
+    name_lower: str
+
+
+def load_squad_players(path: Path) -> Mapping[str, PlayerInfo]:
     """
     Load a squad JSON file and return a mapping:
-        player_id -> 'FirstName LastName'
+        player_id -> PlayerInfo('FirstName LastName', 'firstname lastname')
 
     Expected structure:
     {
@@ -18,15 +31,23 @@ def load_squad_players(path: Path) -> Dict[str, str]:
         }
       ]
     }
+
+    Results are cached per (path, mtime), so repeated builds do not
+    re-read and re-parse an unchanged file.
     """
-    raw = path.read_text(encoding="utf-8")
-    data = json.loads(raw)
+    path = Path(path)
+    return _load_squad_players(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _load_squad_players(path_str: str, mtime_ns: int) -> Mapping[str, PlayerInfo]:
+    data = load_json(Path(path_str))
 
-    players_by_id: Dict[str, str] = {}
+    players_by_id: Dict[str, PlayerInfo] = {}
 
     squad_list = data.get("squad", [])
     if not squad_list:
-        return players_by_id
+        return MappingProxyType(players_by_id)
 
     # In the sample, there is one entry in "squad"
     entry = squad_list[0]
@@ -44,15 +65,17 @@ def load_squad_players(path: Path) -> Dict[str, str]:
             continue
 
         full_name = f"{first} {last}".strip()
-        players_by_id[player_id] = full_name
+        players_by_id[player_id] = PlayerInfo(full_name, full_name.lower())
 
-    return players_by_id
+    # Read-only view so callers cannot mutate the cached value.
+    return MappingProxyType(players_by_id)
 
 
 def resolve_player_name(player_id: str,
-                        players_by_id: Dict[str, str]) -> Optional[str]:
+                        players_by_id: Mapping[str, PlayerInfo]) -> Optional[str]:
     """
     Given a playerRef (id) and a mapping produced by load_squad_players,
-    return the player's full name, or None if unknown.
+    return the player's full display name, or None if unknown.
     """
-    return players_by_id.get(player_id)
+    info = players_by_id.get(player_id)
+    return info.name if info is not None else None
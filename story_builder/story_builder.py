@@ -1,42 +1,70 @@
 from __future__ import annotations
 
-import json
+import heapq
+import itertools
+import secrets
+import sys
 import uuid
-from datetime import datetime
+from collections import ChainMap
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from .core import compute_final_score
+from .core import SCORING_TYPES, _parse_minute, _safe_int, compute_final_score
 from .asset_picker import load_asset_descriptions, pick_asset_for_event
-from .squad_utils import load_squad_players, resolve_player_name
+from .jsonio import dump_json_bytes, load_json
+from .squad_utils import PlayerInfo, load_squad_players
 
 OUT_DIR = Path("out")
 OUT_DIR.mkdir(exist_ok=True)
 
 
 def _utc_now_iso() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+    # datetime.utcnow() is deprecated in 3.12+; now(timezone.utc) is the
+    # supported (and faster) spelling.
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _page_id_factory():
+    """
+    Page ids only need to be unique, not cryptographically random.
+    One 8-hex random prefix per build plus a counter gives unique,
+    readable ids without a urandom read per page.
+    """
+    prefix = secrets.token_hex(4)
+    return (f"{prefix}-{i:04d}" for i in itertools.count(1))
 
 
 def _flatten_events(match_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    Take the match_events.json structure and return a flat, time-sorted list of events.
+    Take the match_events.json structure and return a flat, time-sorted
+    list of the events that can score.
+
+    Non-scoring event types (the majority of a typical feed) are dropped
+    before sorting, so the sort and everything downstream only touch
+    events the builder can actually use. Each kept event is also
+    canonicalized here: _type_lc, _minute_int and _team are cached so no
+    later consumer re-normalizes the same fields.
     """
     messages = match_data["messages"][0]["message"]
 
-    def key(ev: Dict[str, Any]) -> Tuple[int, int]:
-        # minute and second come as strings in the JSON
-        try:
-            minute = int(ev.get("minute", 0))
-        except (TypeError, ValueError):
-            minute = 0
-        try:
-            second = int(ev.get("second", 0))
-        except (TypeError, ValueError):
-            second = 0
-        return minute, second
+    events: List[Dict[str, Any]] = []
+    for ev in messages:
+        ev_type = sys.intern(str(ev.get("type", "")).lower().strip())
+        if ev_type not in SCORING_TYPES:
+            continue
+        ev["_type_lc"] = ev_type
+        ev["_minute_int"] = _parse_minute(ev)
+        # second comes as a string in the JSON
+        ev["_second_int"] = _safe_int(ev.get("second", 0))
+        ev["_team"] = ev.get("teamRef1")
+        events.append(ev)
 
-    return sorted(messages, key=key)
+    # Both sort fields are pre-coerced ints, so the key can be a
+    # C-implemented itemgetter instead of a Python lambda.
+    events.sort(key=itemgetter("_minute_int", "_second_int"))
+    return events
 
 
 def _get_home_away_ids(match_info: Dict[str, Any]) -> Tuple[str, str]:
@@ -62,7 +90,9 @@ def _get_home_away_ids(match_info: Dict[str, Any]) -> Tuple[str, str]:
 
 def _make_cover_page(match_info: Dict[str, Any],
                      final_home: int,
-                     final_away: int) -> Dict[str, Any]:
+                     final_away: int,
+                     created_at: Optional[str] = None,
+                     page_id: Optional[str] = None) -> Dict[str, Any]:
     home = match_info["contestant"][0]["name"]
     away = match_info["contestant"][1]["name"]
     title = f"{home} vs {away}"
@@ -70,29 +100,30 @@ def _make_cover_page(match_info: Dict[str, Any],
     final_score_str = f"{final_home}-{final_away}"
 
     return {
-        "id": str(uuid.uuid4()),
+        "id": page_id or uuid.uuid4().hex,
         "type": "cover",
         # keys the viewer actually uses:
         "headline": title + " - " + date,
         "image": "../assets/cover.jpg",
         # extra metadata is fine, schema allows extra fields:
         "caption": f"Final score {final_score_str}",
-        "created_at": _utc_now_iso(),
+        "created_at": created_at or _utc_now_iso(),
     }
 
 def _make_highlight_page(event: Dict[str, Any],
                          score_breakdown: Dict[str, Any],
                          asset: str,
-                         players: List[str]) -> Dict[str, Any]:
-    # minute should be an integer
-    try:
-        minute_val = int(event.get("minute", 0))
-    except (TypeError, ValueError):
-        minute_val = 0
+                         players: List[str],
+                         created_at: Optional[str] = None,
+                         page_id: Optional[str] = None) -> Dict[str, Any]:
+    # minute should be an integer; prefer the value cached on the event
+    minute_val = event.get("_minute_int")
+    if minute_val is None:
+        minute_val = _parse_minute(event)
 
     headline_parts = []
 
-    etype = str(event.get("type", "")).lower()
+    etype = event.get("_type_lc") or str(event.get("type", "")).lower()
     if etype in ("goal", "penalty goal"):
         headline_parts.append("GOAL")
     elif etype == "yellow card":
@@ -120,7 +151,7 @@ def _make_highlight_page(event: Dict[str, Any],
     explanation = " + ".join(explanation_parts)
 
     return {
-        "id": str(uuid.uuid4()),
+        "id": page_id or uuid.uuid4().hex,
         "type": "highlight",
         # what the viewer reads:
         "minute": minute_val,
@@ -131,23 +162,41 @@ def _make_highlight_page(event: Dict[str, Any],
         "explanation": explanation,
         "players": players,
         "event_type": event.get("type"),
-        "created_at": _utc_now_iso(),
+        "created_at": created_at or _utc_now_iso(),
     }
 
 
 
-def _make_no_highlights_page() -> Dict[str, Any]:
+def _players_for_event(event: Dict[str, Any],
+                       players_by_id: Mapping[str, PlayerInfo]) -> List[PlayerInfo]:
+    """
+    Resolve the (up to two) players involved in an event, dropping
+    unknown ids and duplicates while preserving order. Each entry
+    carries both the display name and its pre-lowercased form.
+    """
+    infos = (
+        players_by_id.get(event.get("playerRef1")),
+        players_by_id.get(event.get("playerRef2")),
+    )
+    return list(dict.fromkeys(info for info in infos if info))
+
+
+def _make_no_highlights_page(created_at: Optional[str] = None,
+                             page_id: Optional[str] = None) -> Dict[str, Any]:
     return {
-        "id": str(uuid.uuid4()),
+        "id": page_id or uuid.uuid4().hex,
         "type": "info",
         "headline": "No highlights available",
         "body": "No events reached the highlight threshold for this match.",
         "image": "../assets/placeholder.png",
-        "created_at": _utc_now_iso(),
+        "created_at": created_at or _utc_now_iso(),
     }
 
 
-def _make_closing_page(final_home: int, final_away: int) -> Dict[str, Any]:
+def _make_closing_page(final_home: int,
+                       final_away: int,
+                       created_at: Optional[str] = None,
+                       page_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Create a closing slide announcing the final result.
     Only added when there are actual highlights in the story.
@@ -155,13 +204,13 @@ def _make_closing_page(final_home: int, final_away: int) -> Dict[str, Any]:
     """
     final_score_str = f"{final_home}-{final_away}"
     return {
-        "id": str(uuid.uuid4()),
+        "id": page_id or uuid.uuid4().hex,
         "type": "highlight",
         "minute": 120,
         "headline": f"Final Score: {final_score_str}",
         "caption": "Match ended",
         "image": "../assets/final.png",
-        "created_at": _utc_now_iso(),
+        "created_at": created_at or _utc_now_iso(),
     }
 
 
@@ -182,21 +231,41 @@ def build_story_from_files(
     """
 
     # Load match data
-    match_data = json.loads(match_events_path.read_text(encoding="utf-8"))
-    match_info = match_data["matchInfo"]
-    events = _flatten_events(match_data)
-
-    # Team IDs for scoring context
-    home_team_id, away_team_id = _get_home_away_ids(match_info)
+    match_data = load_json(match_events_path)
 
-    # Load squads: player_id -> "First Last"
+    # Load squads: player_id -> "First Last". ChainMap gives one lookup
+    # view over both squads without copying every entry into a new dict.
     home_players = load_squad_players(celtic_squad_path)
     away_players = load_squad_players(kilmarnock_squad_path)
-    players_by_id = {**home_players, **away_players}
+    players_by_id = ChainMap(away_players, home_players)
 
     # Load asset descriptions
     asset_db = load_asset_descriptions()
 
+    return build_story_from_data(match_data, players_by_id, asset_db, top_n=top_n)
+
+
+def build_story_from_data(
+    match_data: Dict[str, Any],
+    players_by_id: Mapping[str, PlayerInfo],
+    asset_db,
+    top_n: int = 7,
+    source: str = "../data/match_events.json",
+) -> Dict[str, Any]:
+    """
+    Build a story pack from already-loaded inputs. Useful when the match
+    data does not live in the default files (e.g. synthetic fixtures in
+    tests); build_story_from_files is the file-loading wrapper around
+    this.
+    """
+    match_info = match_data["matchInfo"]
+    # Filtered to scoring types and canonicalized (_type_lc, _minute_int,
+    # _team cached on each event).
+    events = _flatten_events(match_data)
+
+    # Team IDs for scoring context
+    home_team_id, away_team_id = _get_home_away_ids(match_info)
+
     # 1. Compute scores and track running scoreline
     scored_events: List[Tuple[int, Dict[str, Any], Dict[str, Any]]] = []
     score_home = 0
@@ -207,57 +276,60 @@ def build_story_from_files(
         if final_score["score"] > 0:
             scored_events.append((idx, final_score, ev))
 
-        # Update internal score state for future context
-        ev_type = str(ev.get("type", "")).lower().strip()
-        if ev_type in ("goal", "penalty goal"):
-            team = ev.get("teamRef1")
-            if team == home_team_id:
-                score_home += 1
-            elif team == away_team_id:
-                score_away += 1
+        # Update internal score state for future context; the deltas are
+        # classified inside compute_final_score, so no second pass over
+        # the event fields here.
+        score_home += final_score["home_delta"]
+        score_away += final_score["away_delta"]
 
     final_home, final_away = score_home, score_away
 
-    # 2. Choose top N by score, tie breaking by original index for stability
-    scored_events.sort(key=lambda t: (-t[1]["score"], t[0]))
-    selected = scored_events[:top_n]
+    # 2. Choose top N by score, tie breaking by original index for
+    # stability. Heap-select instead of sorting the whole list: top_n is
+    # small relative to the number of scored events.
+    selected = heapq.nsmallest(
+        top_n, scored_events, key=lambda t: (-t[1]["score"], t[0])
+    )
 
     # Reorder selected by original index to keep story chronological
     selected.sort(key=lambda t: t[0])
 
     pages: List[Dict[str, Any]] = []
 
+    # One timestamp for the whole build: hit the clock once instead of
+    # once per page. Page ids come from one random prefix + counter.
+    now_iso = _utc_now_iso()
+    page_ids = _page_id_factory()
+
     # Always add cover page
-    pages.append(_make_cover_page(match_info, final_home, final_away))
+    pages.append(_make_cover_page(match_info, final_home, final_away,
+                                  now_iso, next(page_ids)))
 
     # If we have no selected events, add "no highlights"
     if not selected:
-        pages.append(_make_no_highlights_page())
+        pages.append(_make_no_highlights_page(now_iso, next(page_ids)))
     else:
         for idx, score_breakdown, ev in selected:
-            # Resolve involved players
-            players: List[str] = []
-            p1_id = ev.get("playerRef1")
-            p2_id = ev.get("playerRef2")
-
-            if p1_id:
-                p1_name = resolve_player_name(p1_id, players_by_id)
-                if p1_name:
-                    players.append(p1_name)
-
-            if p2_id:
-                p2_name = resolve_player_name(p2_id, players_by_id)
-                if p2_name and p2_name not in players:
-                    players.append(p2_name)
-
-            # Pick best visual asset
-            asset_path = pick_asset_for_event(ev, players, asset_db)
-
-            page = _make_highlight_page(ev, score_breakdown, asset_path, players)
+            # Resolve involved players once; reused for the headline and
+            # the asset match below.
+            infos = _players_for_event(ev, players_by_id)
+            players = [info.name for info in infos]
+
+            # Pick best visual asset, matching on the pre-lowercased names
+            asset_path = pick_asset_for_event(
+                ev,
+                players,
+                asset_db,
+                player_names_lower=tuple(info.name_lower for info in infos),
+            )
+
+            page = _make_highlight_page(ev, score_breakdown, asset_path, players,
+                                        now_iso, next(page_ids))
             pages.append(page)
 
         # Add closing slide with final result when there are highlights
-        pages.append(_make_closing_page(final_home, final_away))
+        pages.append(_make_closing_page(final_home, final_away,
+                                        now_iso, next(page_ids)))
 
     # 3. Build story object
     home_name = match_info["contestant"][0]["name"]
@@ -270,7 +342,8 @@ def build_story_from_files(
                  if p.get("event_type") in ("goal", "penalty goal")]
 
     story = {
-        "pack_id": str(uuid.uuid4()),
+        # Full uuid for the pack itself; .hex skips the hyphen formatting
+        "pack_id": uuid.uuid4().hex,
         "title": title,
         "pages": pages,
         "metrics": {
@@ -278,19 +351,24 @@ def build_story_from_files(
             "highlights": len(highlight_pages),
         },
         # source should be the path to the events file, not a label
-        "source": "../data/match_events.json",
-        "created_at": _utc_now_iso(),
+        "source": source,
+        "created_at": now_iso,
     }
 
-  
-
     return story
 
 
-def save_story(story: Dict[str, Any], filename: str = "story.json") -> str:
+def save_story(story: Dict[str, Any],
+               filename: str = "story.json",
+               compact: bool = False) -> str:
+    """
+    Write the story pack to out/<filename>. Pretty-printing is only for
+    humans reading the file; pass compact=True to skip indentation
+    entirely, which is the fastest serialization path.
+    """
     OUT_DIR.mkdir(exist_ok=True)
     out_path = OUT_DIR / filename
-    out_path.write_text(json.dumps(story, indent=2), encoding="utf-8")
+    out_path.write_bytes(dump_json_bytes(story, indent=not compact))
     return str(out_path)
 
 
@@ -0,0 +1,56 @@
+"""
+Cached access to the story schema and its compiled validator.
+
+The schema lives in schema/story.schema.json next to the package (it is
+data shared with non-Python consumers, not a Python resource), so it is
+resolved relative to this file. Loading and compiling are both cached at
+module level: every importer — the test suite, future CLI validation —
+pays the parse and compile cost once per process.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from .jsonio import load_json
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "schema" / "story.schema.json"
+
+
+@lru_cache(maxsize=1)
+def load_story_schema() -> Dict[str, Any]:
+    """Parse schema/story.schema.json once per process."""
+    return load_json(SCHEMA_PATH)
+
+
+@lru_cache(maxsize=1)
+def story_validator() -> "Callable[[Any], Any]":
+    """
+    Return a callable that validates a story dict against the schema,
+    raising on failure.
+
+    Prefers fastjsonschema, which compiles the schema to a specialized
+    function, and falls back to a jsonschema Draft202012Validator.
+    Compiling is the expensive part, hence the cache.
+    """
+    schema = load_story_schema()
+    try:
+        import fastjsonschema
+
+        # handlers={} disables remote ref fetching: if the schema ever
+        # grows external $refs they must be added to this store rather
+        # than re-fetched per compile.
+        return fastjsonschema.compile(schema, handlers={})
+    except ImportError:
+        import jsonschema
+        from referencing import Registry, Resource
+
+        # Pre-register the schema in an in-memory registry so any
+        # future internal $ref resolves without per-call lookups (the
+        # legacy RefResolver that re-resolved per validate is
+        # deprecated).
+        registry = Registry().with_resource(
+            schema.get("$id", ""), Resource.from_contents(schema)
+        )
+        return jsonschema.Draft202012Validator(schema, registry=registry).validate
@@ -33,7 +33,12 @@ def cli() -> None:
     show_default=True,
     help="Output JSON filename inside the out/ folder.",
 )
-def build(top_n: int, out_filename: str) -> None:
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Write the story without indentation (fastest).",
+)
+def build(top_n: int, out_filename: str, compact: bool) -> None:
     """
     Build a story pack from the default match and squad files.
     """
@@ -43,7 +48,7 @@ def build(top_n: int, out_filename: str) -> None:
         kilmarnock_squad_path=KILMARNOCK_SQUAD_PATH,
         top_n=top_n,
     )
-    out_path = save_story(story, filename=out_filename)
+    out_path = save_story(story, filename=out_filename, compact=compact)
     click.echo(f"Story written to {out_path}")
 
 
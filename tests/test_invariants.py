@@ -13,28 +13,54 @@ Tests cover:
 9. Deduplication logic
 """
 
-import json
-import uuid
+import copy
+import re
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Dict, List
 
 import pytest
 import jsonschema
 
+try:
+    import numpy as np
+except ImportError:  # optional speedup, pure-Python checks still work
+    np = None
+
+from story_builder.asset_picker import AssetDB
 from story_builder.core import compute_final_score, compute_context_bonus
 from story_builder.story_builder import (
+    build_story_from_data,
     build_story_from_files,
     _make_cover_page,
     _make_highlight_page,
     _make_no_highlights_page,
 )
+from story_builder.validation import load_story_schema, story_validator
+
+
+# Repo root, so the suite resolves data files the same way from any
+# working directory (or any pytest-xdist worker).
+REPO = Path(__file__).resolve().parent.parent
+
+# Schema parsing and validator compilation live in
+# story_builder.validation, cached at module level: the suite shares one
+# compiled validator with every other consumer in the process instead of
+# loading and compiling its own copy here.
+STORY_SCHEMA = load_story_schema()
+jsonschema.Draft202012Validator.check_schema(STORY_SCHEMA)
+_validate = story_validator()
 
+# story_validator prefers fastjsonschema, so mirror its exception choice.
+try:
+    import fastjsonschema
 
-# Load the JSON schema once
-SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "story.schema.json"
-with open(SCHEMA_PATH) as f:
-    STORY_SCHEMA = json.load(f)
+    SchemaError = fastjsonschema.JsonSchemaException
+except ImportError:
+    SchemaError = jsonschema.ValidationError
 
 
 class TestInvariant1_SchemaValidation:
@@ -42,32 +68,34 @@ class TestInvariant1_SchemaValidation:
 
     def test_valid_story_passes_schema(self, sample_story_dict):
         """A well-formed story should validate against the schema."""
-        jsonschema.validate(sample_story_dict, STORY_SCHEMA)
+        _validate(sample_story_dict)
 
     def test_missing_required_field_fails_schema(self, sample_story_dict):
         """Story missing required fields should fail schema validation."""
-        del sample_story_dict["pack_id"]
-        with pytest.raises(jsonschema.ValidationError):
-            jsonschema.validate(sample_story_dict, STORY_SCHEMA)
+        # Deep copy before mutating: the fixture is module-scoped.
+        broken = copy.deepcopy(sample_story_dict)
+        del broken["pack_id"]
+        with pytest.raises(SchemaError):
+            _validate(broken)
 
     def test_invalid_page_type_fails_schema(self, sample_story_dict):
         """Pages with invalid type field should fail."""
-        sample_story_dict["pages"][0]["type"] = "invalid_type"
-        with pytest.raises(jsonschema.ValidationError):
-            jsonschema.validate(sample_story_dict, STORY_SCHEMA)
+        broken = copy.deepcopy(sample_story_dict)
+        broken["pages"][0]["type"] = "invalid_type"
+        with pytest.raises(SchemaError):
+            _validate(broken)
 
 
 class TestInvariant2_CoverPageAtIndex0:
     """Invariant 2: Contains exactly one cover Page at index 0."""
 
-    def test_cover_page_at_index_0(self, sample_story_dict):
+    def test_cover_page_at_index_0(self, story_stats):
         """First page must be a cover page."""
-        assert sample_story_dict["pages"][0]["type"] == "cover"
+        assert story_stats["cover_indices"][:1] == [0]
 
-    def test_exactly_one_cover_page(self, sample_story_dict):
+    def test_exactly_one_cover_page(self, story_stats):
         """There should be exactly one cover page in entire story."""
-        cover_pages = [p for p in sample_story_dict["pages"] if p["type"] == "cover"]
-        assert len(cover_pages) == 1
+        assert story_stats["types"]["cover"] == 1
 
     def test_no_highlights_story_has_cover_then_info(self):
         """Even with no highlights, cover should be at index 0."""
@@ -76,58 +104,124 @@ class TestInvariant2_CoverPageAtIndex0:
         # When this is added to story, it comes after cover so at index 1
 
 
+def _freeze(x):
+    """Recursively turn dicts/lists into hashable tuples so pages can be
+    dropped straight into a set, without serializing them to JSON."""
+    if isinstance(x, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in x.items()))
+    if isinstance(x, list):
+        return tuple(_freeze(v) for v in x)
+    return x
+
+
 class TestInvariant3_UniqueHighlights:
     """Invariant 3: pages[1:] contain only unique highlights (no exact duplicates)."""
 
     def test_no_duplicate_highlights(self, sample_story_with_highlights):
         """No two highlight pages should be identical."""
         highlights = [p for p in sample_story_with_highlights["pages"] if p["type"] == "highlight"]
-        
-        # Convert each to JSON string for comparison
-        highlight_jsons = [json.dumps(h, sort_keys=True) for h in highlights]
-        
+
         # set() removes duplicates, so if all is unique, lengths should match
-        assert len(highlight_jsons) == len(set(highlight_jsons)), \
-            "Found duplicate highlight pages"
+        seen = set(map(_freeze, highlights))
+        assert len(seen) == len(highlights), "Found duplicate highlight pages"
+
+
+
+def _page_order(story):
+    """Order signature of a story's pages (type, minute, headline),
+    ignoring the random ids. Binding page.get once per page keeps it to
+    a single attribute lookup instead of three dict accesses through p."""
+    order = []
+    append = order.append
+    for page in story["pages"]:
+        get = page.get
+        append((get("type"), get("minute"), get("headline")))
+    return order
 
 
+@lru_cache(maxsize=8)
+def _cached_build(match_events_path, celtic_path, kilmarnock_path, top_n):
+    """Build a story once per unique input set and memoize the result,
+    so multiple tests over the same real data share one build."""
+    return build_story_from_files(
+        match_events_path=match_events_path,
+        celtic_squad_path=celtic_path,
+        kilmarnock_squad_path=kilmarnock_path,
+        top_n=top_n,
+    )
+
 
 class TestInvariant4_StableOrdering:
     """Invariant 4: Ordering is stable and deterministic for the same input."""
 
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        not (REPO / "data" / "match_events.json").exists(),
+        reason="real match data not available",
+    )
     def test_same_input_produces_same_output_order(self):
         """Running the builder twice with same input should produce same event order."""
-        match_events_path = Path("data/match_events.json")
-        celtic_path = Path("data/celtic-squad.json")
-        kilmarnock_path = Path("data/kilmarnock-squad.json")
-        
-        # Build twice
-        story1 = build_story_from_files(
-            match_events_path=match_events_path,
-            celtic_squad_path=celtic_path,
-            kilmarnock_squad_path=kilmarnock_path,
-            top_n=5,
-        )
+        match_events_path = REPO / "data" / "match_events.json"
+        celtic_path = REPO / "data" / "celtic-squad.json"
+        kilmarnock_path = REPO / "data" / "kilmarnock-squad.json"
+
+        # One memoized build plus one fresh build: comparing them still
+        # exercises determinism, and other tests can reuse the cached pack
+        # without re-running the whole pipeline.
+        story1 = _cached_build(match_events_path, celtic_path, kilmarnock_path, 5)
         story2 = build_story_from_files(
             match_events_path=match_events_path,
             celtic_squad_path=celtic_path,
             kilmarnock_squad_path=kilmarnock_path,
             top_n=5,
         )
-        
+
         # Extract page order (ignoring UUIDs which are random)
-        pages1_order = [(p["type"], p.get("minute"), p.get("headline")) for p in story1["pages"]]
-        pages2_order = [(p["type"], p.get("minute"), p.get("headline")) for p in story2["pages"]]
-        
-        assert pages1_order == pages2_order, "Story ordering is not deterministic"
+        assert _page_order(story1) == _page_order(story2), \
+            "Story ordering is not deterministic"
+
+    def test_synthetic_input_is_deterministic(self):
+        """Determinism also holds for small in-memory match data."""
+        def make_match_data():
+            return {
+                "matchInfo": {
+                    "contestant": [
+                        {"id": "team_a", "name": "Team A", "position": "home"},
+                        {"id": "team_b", "name": "Team B", "position": "away"},
+                    ],
+                    "localDate": "2025-11-26",
+                },
+                "messages": [
+                    {
+                        "message": [
+                            {"type": "attempt saved", "minute": "80", "second": "30", "teamRef1": "team_b"},
+                            {"type": "goal", "minute": "10", "second": "0", "teamRef1": "team_a"},
+                        ]
+                    }
+                ],
+            }
+
+        empty_assets = AssetDB(filenames=(), descriptions_lower=(), kw_masks=())
+        story1 = build_story_from_data(make_match_data(), {}, empty_assets, top_n=5)
+        story2 = build_story_from_data(make_match_data(), {}, empty_assets, top_n=5)
 
-    def test_highlights_ordered_chronologically(self, sample_story_with_highlights):
+        assert _page_order(story1) == _page_order(story2)
+        # Sanity: the two events end up in chronological order after the cover
+        assert [p.get("minute") for p in story1["pages"][1:3]] == [10, 80]
+
+    def test_highlights_ordered_chronologically(self, highlight_story_stats):
         """Highlight pages should be ordered by minute (chronological)."""
-        highlights = [p for p in sample_story_with_highlights["pages"] if p["type"] == "highlight"]
-        
-        if len(highlights) > 1:
-            minutes = [p.get("minute", 0) for p in highlights]
-            assert minutes == sorted(minutes), "Highlights are not in chronological order"
+        minutes = highlight_story_stats["highlight_minutes"]
+        if np is not None:
+            # One vectorized diff scan; no sort, no Python-level loop.
+            mins = np.fromiter(minutes, dtype=np.int32, count=len(minutes))
+            assert np.all(np.diff(mins) >= 0), "Highlights are not in chronological order"
+        else:
+            # Single pass, comparing each minute against the previous one.
+            prev = -1
+            for minute in minutes:
+                assert minute >= prev, "Highlights are not in chronological order"
+                prev = minute
 
 
 class TestInvariant5_NoHighlightsFallback:
@@ -151,19 +245,27 @@ class TestInvariant5_NoHighlightsFallback:
             assert field in info_page, f"Missing field: {field}"
 
 
+# Shape check for the UTC timestamps the builder emits. A regex match
+# is much cheaper than datetime.fromisoformat, which builds a datetime
+# object per call just to throw it away.
+_ISO8601 = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z$")
+
+
 class TestInvariant6_ISO8601Timestamp:
     """Invariant 6: created_at is ISO-8601 (UTC recommended)."""
 
-    def test_created_at_is_iso8601(self, sample_story_dict):
+    def test_created_at_is_iso8601(self, story_stats):
         """All pages should have ISO-8601 created_at."""
-        for page in sample_story_dict["pages"]:
-            created_at = page.get("created_at")
+        for created_at in story_stats["timestamps"]:
             assert created_at is not None, "Page missing created_at"
-            
-            # Should end with Z (UTC indicator)
-            assert created_at.endswith("Z"), f"Timestamp not UTC: {created_at}"
-            
-            # Should be parseable as ISO format
+            assert _ISO8601.match(created_at), f"Invalid ISO-8601 timestamp: {created_at}"
+
+    @pytest.mark.slow
+    def test_created_at_parses_as_datetime(self, sample_story_dict):
+        """Semantic double-check: the timestamps really parse as datetimes
+        (the fast path above only validates their shape)."""
+        for page in sample_story_dict["pages"]:
+            created_at = page["created_at"]
             try:
                 datetime.fromisoformat(created_at.rstrip("Z"))
             except ValueError:
@@ -190,54 +292,41 @@ class TestInvariant7_SourceField:
         assert "match_events.json" in source, f"Source doesn't reference match_events: {source}"
 
 
+# Event dicts shared by the scoring tests, built once at import instead
+# of per test call. compute_final_score never mutates its event, and
+# MappingProxyType makes that sharing enforced.
+EARLY_GOAL = MappingProxyType({"type": "goal", "minute": "10", "teamRef1": "team_a"})
+LATE_GOAL = MappingProxyType({"type": "goal", "minute": "90", "teamRef1": "team_a"})
+FIRST_GOAL = MappingProxyType({"type": "goal", "minute": "5", "teamRef1": "team_a"})
+EQUALIZER_GOAL = MappingProxyType({"type": "goal", "minute": "45", "teamRef1": "team_b"})
+
+
 class TestEventScoringLogic:
     """Test the scoring and ranking system."""
 
     def test_late_goal_scores_higher_than_early_goal(self):
         """A goal at minute 90 should rank higher than at minute 10."""
-        early_goal = {
-            "type": "goal",
-            "minute": "10",
-            "teamRef1": "team_a",
-        }
-        late_goal = {
-            "type": "goal",
-            "minute": "90",
-            "teamRef1": "team_a",
-        }
-        
         # First goal scenario
-        early_score = compute_final_score(early_goal, 0, 0, "team_a", "team_b")
-        late_score = compute_final_score(late_goal, 0, 0, "team_a", "team_b")
-        
+        early_score = compute_final_score(EARLY_GOAL, 0, 0, "team_a", "team_b")
+        late_score = compute_final_score(LATE_GOAL, 0, 0, "team_a", "team_b")
+
         assert late_score["score"] > early_score["score"], \
             "Late goal should score higher than early goal"
 
-    def test_equalizer_gets_bonus(self):
-        """An equalizing goal should get a bonus."""
-        equalizer = {
-            "type": "goal",
-            "minute": "45",
-            "teamRef1": "team_b",
-        }
-        
-        # Score is 1-0, team_b scores to make it 1-1
-        score_result = compute_final_score(equalizer, 1, 0, "team_a", "team_b")
-        
-        # Should have equalizer bonus in reasons
-        assert "equalizer=30" in score_result["bonus_reasons"]
-
-    def test_first_goal_gets_bonus(self):
-        """The first goal of the match should get a bonus."""
-        first_goal = {
-            "type": "goal",
-            "minute": "5",
-            "teamRef1": "team_a",
-        }
-        
-        score_result = compute_final_score(first_goal, 0, 0, "team_a", "team_b")
-        
-        assert "first_goal=25" in score_result["bonus_reasons"]
+    @pytest.mark.parametrize(
+        "event,scoreline,expected_reason",
+        [
+            # The first goal of the match should get a bonus.
+            (FIRST_GOAL, (0, 0), "first_goal=25"),
+            # Score is 1-0, team_b scores to make it 1-1: equalizer bonus.
+            (EQUALIZER_GOAL, (1, 0), "equalizer=30"),
+        ],
+        ids=["first_goal", "equalizer"],
+    )
+    def test_goal_context_bonus_reason(self, event, scoreline, expected_reason):
+        """Goals in a bonus-worthy game state should report the reason."""
+        score_result = compute_final_score(event, *scoreline, "team_a", "team_b")
+        assert expected_reason in score_result["bonus_reasons"]
 
     
 class TestScoringBreakdown:
@@ -245,13 +334,7 @@ class TestScoringBreakdown:
 
     def test_score_includes_breakdown_structure(self):
         """Scoring result should have breakdown fields: base, context_bonus, bonus_reasons."""
-        goal = {
-            "type": "goal",
-            "minute": "90",
-            "teamRef1": "team_a",
-        }
-        
-        result = compute_final_score(goal, 0, 0, "team_a", "team_b")
+        result = compute_final_score(LATE_GOAL, 0, 0, "team_a", "team_b")
         
         # Verify all breakdown components exist
         assert "base" in result, "Missing base score"
@@ -265,16 +348,48 @@ class TestScoringBreakdown:
 # Fixtures
 #############################
 
+# The invariant tests only check structure, so fixtures use fixed ids:
+# no urandom read per uuid4() call, and fixture contents are fully
+# reproducible between runs.
+_FIXED_IDS = [f"00000000-0000-0000-0000-{i:012x}" for i in range(16)]
+
+# Canonical key order for highlight pages built in fixtures. Emitting
+# keys in one fixed order makes any serialized form of a page
+# deterministic without a per-page key sort (the set-based duplicate
+# check in _freeze sorts tuples, but json.dumps-style comparisons would
+# otherwise need sort_keys=True).
+_HIGHLIGHT_KEYS = (
+    "id",
+    "type",
+    "minute",
+    "headline",
+    "caption",
+    "image",
+    "explanation",
+    "players",
+    "event_type",
+    "created_at",
+)
 
-@pytest.fixture
+
+def _hp(**kw):
+    """Build a highlight page dict with keys in canonical order."""
+    return {k: kw[k] for k in _HIGHLIGHT_KEYS if k in kw}
+
+
+@pytest.fixture(scope="module")
 def sample_story_dict():
-    """Return a minimal valid story dict for testing."""
+    """Return a minimal valid story dict for testing.
+
+    Module-scoped: built once for the whole module, so tests that mutate
+    it must deep-copy first.
+    """
     return {
-        "pack_id": str(uuid.uuid4()),
+        "pack_id": _FIXED_IDS[0],
         "title": "Test Match",
         "pages": [
             {
-                "id": str(uuid.uuid4()),
+                "id": _FIXED_IDS[1],
                 "type": "cover",
                 "headline": "Team A vs Team B",
                 "image": "../assets/cover.jpg",
@@ -282,7 +397,7 @@ def sample_story_dict():
                 "created_at": "2025-11-26T12:00:00Z",
             },
             {
-                "id": str(uuid.uuid4()),
+                "id": _FIXED_IDS[2],
                 "type": "info",
                 "headline": "Test Info",
                 "body": "This is test information.",
@@ -299,15 +414,15 @@ def sample_story_dict():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_story_with_highlights():
     """Return a story with actual highlight pages."""
     story = {
-        "pack_id": str(uuid.uuid4()),
+        "pack_id": _FIXED_IDS[3],
         "title": "Test Match with Highlights",
         "pages": [
             {
-                "id": str(uuid.uuid4()),
+                "id": _FIXED_IDS[4],
                 "type": "cover",
                 "headline": "Team A vs Team B",
                 "image": "../assets/cover.jpg",
@@ -321,24 +436,60 @@ def sample_story_with_highlights():
     }
     
     # Add two highlight pages
-    for minute in [15, 80]:
-        story["pages"].append({
-            "id": str(uuid.uuid4()),
-            "type": "highlight",
-            "minute": minute,
-            "headline": f"GOAL — Player {minute}",
-            "caption": f"Goal at minute {minute}",
-            "image": f"../assets/player_{minute}.jpg",
-            "explanation": f"base score=100 + late_game=15",
-            "players": [f"Player {minute}"],
-            "event_type": "goal",
-            "created_at": f"2025-11-26T12:00:{minute % 60:02d}Z",
-        })
-    
+    for i, minute in enumerate([15, 80]):
+        story["pages"].append(_hp(
+            id=_FIXED_IDS[5 + i],
+            type="highlight",
+            minute=minute,
+            headline=f"GOAL — Player {minute}",
+            caption=f"Goal at minute {minute}",
+            image=f"../assets/player_{minute}.jpg",
+            explanation="base score=100 + late_game=15",
+            players=[f"Player {minute}"],
+            event_type="goal",
+            created_at=f"2025-11-26T12:00:{minute % 60:02d}Z",
+        ))
+
     return story
 
 
-@pytest.fixture
+def _page_stats(story):
+    """Collect the per-page facts the invariant tests assert on in one
+    walk over story["pages"], so each consuming test reads the derived
+    stats instead of re-walking the pages list."""
+    types = Counter()
+    cover_indices = []
+    timestamps = []
+    highlight_minutes = []
+    for i, page in enumerate(story["pages"]):
+        ptype = page["type"]
+        types[ptype] += 1
+        if ptype == "cover":
+            cover_indices.append(i)
+        elif ptype == "highlight":
+            highlight_minutes.append(page.get("minute", 0))
+        timestamps.append(page.get("created_at"))
+    return {
+        "types": types,
+        "cover_indices": cover_indices,
+        "timestamps": timestamps,
+        "highlight_minutes": highlight_minutes,
+    }
+
+
+@pytest.fixture(scope="module")
+def story_stats(sample_story_dict):
+    """Derived page stats for sample_story_dict, computed once per module."""
+    return _page_stats(sample_story_dict)
+
+
+@pytest.fixture(scope="module")
+def highlight_story_stats(sample_story_with_highlights):
+    """Derived page stats for sample_story_with_highlights."""
+    return _page_stats(sample_story_with_highlights)
+
+
+@pytest.fixture(scope="module")
 def empty_match_data():
     """Return match data with no scoreable events."""
     return {
@@ -0,0 +1,31 @@
+"""
+Benchmark guard for the event-scoring hot path.
+
+compute_final_score runs once per scoring event on every build, so a
+regression there multiplies across the whole pipeline. The benchmark is
+marked slow and skipped entirely when pytest-benchmark is not
+installed; run it with
+
+    pytest tests/test_perf_scoring.py -m slow
+
+and compare against a stored baseline via --benchmark-save / \
+--benchmark-compare when chasing a regression.
+"""
+
+import pytest
+
+from story_builder.core import compute_final_score
+
+pytest.importorskip("pytest_benchmark")
+
+
+# A late goal exercises the deepest path: base score, minute bucketing,
+# scoreline classification and the bonus-table lookup.
+_EVENT = {"type": "goal", "minute": "90", "teamRef1": "team_a"}
+
+
+@pytest.mark.slow
+def test_score_benchmark(benchmark):
+    result = benchmark(compute_final_score, _EVENT, 0, 0, "team_a", "team_b")
+    # Sanity-check the benchmarked call really took the scoring path.
+    assert result["score"] > 0